@@ -14,13 +14,13 @@ EnergyManagementSystem (EMS) objects to control thermal comfort dynamically.
 import warnings
 import os
 import re
-from typing import Dict, Any, List, Union, Optional
+from itertools import product
+from typing import Dict, Any, Iterable, List, NamedTuple, Set, Union, Optional
 import pandas as pd
 from besos.IDF_class import IDF
 import besos.objectives
 import eppy
 from accim.utils import transform_ddmm_to_int
-import accim.sim.accim_Main_single_idf as accim_Main
 
 # ==============================================================================
 # MONKEY PATCH FOR BESOS (Suppress Errors Only)
@@ -52,6 +52,18 @@ try:
         :return: The parsed results object if successful, or None if parsing fails.
         """
         try:
+            # A missing or empty results file can never be parsed, so skip the
+            # expensive read (and the exception it would raise) altogether.
+            # The check sits inside the try so that a bad out_dir or an OSError
+            # is reported like any other read failure.
+            path = os.path.join(out_dir, file_name)
+            if not os.path.isfile(path) or os.path.getsize(path) == 0:
+                warnings.warn(
+                    f"BESOS could not read the results file '{file_name}' because it is missing or empty. "
+                    f"Execution continues without output data."
+                )
+                return None
+
             # Attempt to execute the original BESOS reading function.
             return _original_read_eso(out_dir, file_name)
         except Exception as e:
@@ -76,6 +88,10 @@ except ImportError:
 # CORE RESOLUTION LOGIC
 # ==============================================================================
 
+# Any character that is NOT a letter (a-z, A-Z), a number (0-9), or an underscore (_).
+_EMS_INVALID_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+
 def _sanitize_ems_name(name: str) -> str:
     """
     Sanitizes a string to be used as a valid EnergyManagementSystem (EMS) variable name.
@@ -89,12 +105,66 @@ def _sanitize_ems_name(name: str) -> str:
     :param name: The original name string from the IDF object (e.g., "Zone 1: Space-A").
     :return: A sanitized string safe for EMS usage (e.g., "Zone_1__Space_A").
     """
-    # Use Regular Expression to replace ANY character that is NOT
-    # a letter (a-z, A-Z), a number (0-9), or an underscore (_) with an underscore.
-    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+    # Replace every invalid character with an underscore.
+    return _EMS_INVALID_CHARS.sub('_', name)
+
+
+# Candidate names of the People field holding the Zone/ZoneList/Space/SpaceList assignment,
+# which differ between EnergyPlus versions.
+_PEOPLE_CONTAINER_FIELDS = (
+    'Zone_or_ZoneList_Name',
+    'Zone_or_ZoneList_or_Space_or_SpaceList_Name',
+    'Zone_Name',
+)
+
+
+def _get_people_container_field(people) -> str:
+    """
+    Returns the name of the field that holds the container (Zone, ZoneList, Space or SpaceList)
+    of a People object in the IDD version of the model.
+
+    :param people: Any 'People' object of the model.
+    :return: The field name, to be read with getattr() from every People object of the model.
+    """
+    fieldnames = people.fieldnames
+    for field in _PEOPLE_CONTAINER_FIELDS:
+        if field in fieldnames:
+            return field
+    return _PEOPLE_CONTAINER_FIELDS[-1]
 
 
-def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
+def _get_list_items(obj, field_prefix: str) -> List[str]:
+    """
+    Extracts the member names from an extensible list object (ZoneList or SpaceList).
+
+    Eppy exposes the fields actually present in the object through fieldnames/fieldvalues,
+    so we walk those instead of probing Zone_1_Name, Zone_2_Name... until an exception is raised.
+
+    :param obj: The ZoneList or SpaceList object.
+    :param field_prefix: Prefix of the extensible fields (e.g., "Zone" or "Space").
+    :return: The member names, up to the first empty field.
+    """
+    items = []
+    # Extensible fields are named e.g. "Zone_1_Name" or "Space_1_Name"
+    start = f"{field_prefix}_"
+    for field, val in zip(obj.fieldnames, obj.fieldvalues):
+        if field.startswith(start) and field.endswith("_Name"):
+            if not val:
+                # Stop if we hit an empty field
+                break
+            items.append(val)
+    return items
+
+
+class _Target(NamedTuple):
+    """A target control unit resolved by _resolve_targets."""
+    df_key: str  # Unique identifier for user input DataFrames (e.g., "Space1 People1")
+    ems_suffix: str  # Sanitized string for EMS variable naming (e.g., "Space1_People1")
+    sensor_key: str  # The exact key E+ expects for the Sensor object (e.g., "Space1 People1")
+    zone_name: str  # The raw name of the Zone (Schedules/Thermostats are always Zone-based)
+
+
+def _resolve_targets(building: IDF) -> List[_Target]:
     """
     Analyzes the IDF to find all 'People' objects and resolves their target Zones or Spaces
     for EMS application. It follows a strict Global Hierarchy to determine the target level.
@@ -118,34 +188,35 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
          Target resolves to 'ZoneName' (Sensor uses PeopleName).
 
     :param building: The BESOS/eppy IDF object representing the building model.
-    :return: A list of dictionaries, where each dictionary represents a target control unit:
-             - 'df_key': Unique identifier for user input DataFrames (e.g., "Space1 People1").
-             - 'ems_suffix': Sanitized string for EMS variable naming (e.g., "Space1_People1").
-             - 'sensor_key': The exact key E+ expects for the Sensor object (e.g., "Space1 People1").
-             - 'zone_name': The raw name of the Zone (used for Schedules/Thermostats, which are always Zone-based).
+    :return: A list of _Target tuples, where each one represents a target control unit:
+             - df_key: Unique identifier for user input DataFrames (e.g., "Space1 People1").
+             - ems_suffix: Sanitized string for EMS variable naming (e.g., "Space1_People1").
+             - sensor_key: The exact key E+ expects for the Sensor object (e.g., "Space1 People1").
+             - zone_name: The raw name of the Zone (used for Schedules/Thermostats, which are always Zone-based).
     """
     targets = []
 
     # --- 1. BUILD LOOKUP DICTIONARIES ---
     # We pre-fetch all relevant objects to avoid repeated searches during iteration.
-    # We use try-except blocks to handle different EnergyPlus versions safely.
+    # The object lists are fetched once here; a KeyError means the IDD version does not
+    # define that object type, in which case we continue with an empty list.
+    idfo = building.idfobjects
 
     # Check for Spaces (Modern versions)
-    has_spaces = False
     try:
-        if len(building.idfobjects['SPACE']) > 0 or len(building.idfobjects['SPACELIST']) > 0:
-            has_spaces = True
+        space_objs = idfo['SPACE']
+        spacelist_objs = idfo['SPACELIST']
     except KeyError:
         # KeyError means the IDD version doesn't support SPACE objects (Legacy versions)
-        pass
+        space_objs = spacelist_objs = []
+    has_spaces = len(space_objs) > 0 or len(spacelist_objs) > 0
 
     # Check for ZoneLists (All versions)
-    has_zonelists = False
     try:
-        if len(building.idfobjects['ZONELIST']) > 0:
-            has_zonelists = True
+        zonelist_objs = idfo['ZONELIST']
     except KeyError:
-        pass
+        zonelist_objs = []
+    has_zonelists = len(zonelist_objs) > 0
 
     # Initialize lookup dictionaries
     zone_lists = {}  # Map: ZoneList Name -> ZoneList Object
@@ -155,66 +226,42 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
 
     # Populate ZoneLists dictionary
     if has_zonelists:
-        for zl in building.idfobjects['ZONELIST']:
+        for zl in zonelist_objs:
             # Store keys in UPPERCASE and stripped for robust matching
             zone_lists[zl.Name.upper().strip()] = zl
 
     # Populate Space dictionaries (only if spaces exist)
     if has_spaces:
-        try:
-            # Map SpaceLists
-            for sl in building.idfobjects['SPACELIST']:
-                space_lists[sl.Name.upper().strip()] = sl
-
-            # Map Spaces and their relationships to Zones
-            for s in building.idfobjects['SPACE']:
-                s_name = s.Name.strip()
-                s_key = s_name.upper()
-                z_name = s.Zone_Name.strip()
-
-                # Forward map: Space -> Zone
-                space_to_zone[s_key] = z_name
-
-                # Reverse map: Zone -> [Space1, Space2, ...]
-                z_key = z_name.upper()
-                if z_key not in zone_to_spaces:
-                    zone_to_spaces[z_key] = []
-                zone_to_spaces[z_key].append(s_name)
-        except KeyError:
-            pass
-
-    # Helper function to extract items from extensible lists (ZoneList or SpaceList)
-    # Eppy handles extensible fields (Zone_1_Name, Zone_2_Name...) dynamically.
-    def get_items_from_list(obj, field_prefix):
-        items = []
-        # Arbitrary limit of 500 items per list to prevent infinite loops.
-        for i in range(1, 500):
-            try:
-                # Construct field name: e.g., "Zone_1_Name" or "Space_1_Name"
-                val = obj[f"{field_prefix}_{i}_Name"]
-                if val:
-                    items.append(val)
-                else:
-                    # Stop if we hit an empty field
-                    break
-            except:
-                # Stop if the field doesn't exist in the IDD
-                break
-        return items
+        # Map SpaceLists
+        for sl in spacelist_objs:
+            space_lists[sl.Name.upper().strip()] = sl
+
+        # Map Spaces and their relationships to Zones
+        for s in space_objs:
+            s_name = s.Name.strip()
+            s_key = s_name.upper()
+            z_name = s.Zone_Name.strip()
+
+            # Forward map: Space -> Zone
+            space_to_zone[s_key] = z_name
+
+            # Reverse map: Zone -> [Space1, Space2, ...]
+            z_key = z_name.upper()
+            if z_key not in zone_to_spaces:
+                zone_to_spaces[z_key] = []
+            zone_to_spaces[z_key].append(s_name)
+
+    # (SpaceName, ParentZoneName) expansions of SpaceLists/ZoneLists, keyed by container name.
+    # Lists shared by several People objects are walked (and upper-cased) only once.
+    expanded_lists = {}
 
     # --- 2. ITERATE PEOPLE OBJECTS ---
     # We process every 'People' object in the model to determine what it controls.
-    for people in building.idfobjects['PEOPLE']:
-
-        # Robustly find the container name (the field name varies by E+ version)
-        container_name = ""
-        try:
-            container_name = people.Zone_or_ZoneList_Name
-        except:
-            try:
-                container_name = people.Zone_or_ZoneList_or_Space_or_SpaceList_Name
-            except:
-                container_name = people.Zone_Name
+    people_objs = idfo['PEOPLE']
+    # The container field name varies by E+ version, but is the same for every People object.
+    container_field = _get_people_container_field(people_objs[0]) if people_objs else None
+    for people in people_objs:
+        container_name = getattr(people, container_field)
 
         if not container_name:
             continue  # Skip if unassigned
@@ -231,12 +278,14 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
 
             # A. Assigned to SPACELIST -> Expand to individual Spaces
             if c_name_upper in space_lists:
-                sl_obj = space_lists[c_name_upper]
-                s_names = get_items_from_list(sl_obj, "Space")
-                for s in s_names:
-                    # Find the parent zone for this space
-                    z = space_to_zone.get(s.upper().strip(), s)  # Fallback to space name if orphan
-                    target_spaces.append((s, z))
+                if c_name_upper not in expanded_lists:
+                    expanded = []
+                    for s in _get_list_items(space_lists[c_name_upper], "Space"):
+                        # Find the parent zone for this space
+                        z = space_to_zone.get(s.upper().strip(), s)  # Fallback to space name if orphan
+                        expanded.append((s, z))
+                    expanded_lists[c_name_upper] = expanded
+                target_spaces = expanded_lists[c_name_upper]
 
             # B. Assigned to SPACE -> Direct mapping
             elif c_name_upper in space_to_zone:
@@ -246,13 +295,15 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
 
             # C. Assigned to ZONELIST -> Find all spaces within those zones
             elif c_name_upper in zone_lists:
-                zl_obj = zone_lists[c_name_upper]
-                z_names = get_items_from_list(zl_obj, "Zone")
-                for z in z_names:
-                    # Look up the spaces belonging to this zone
-                    spaces_in_z = zone_to_spaces.get(z.upper().strip(), [])
-                    for s in spaces_in_z:
-                        target_spaces.append((s, z))
+                if c_name_upper not in expanded_lists:
+                    expanded = []
+                    for z in _get_list_items(zone_lists[c_name_upper], "Zone"):
+                        # Look up the spaces belonging to this zone
+                        spaces_in_z = zone_to_spaces.get(z.upper().strip(), [])
+                        for s in spaces_in_z:
+                            expanded.append((s, z))
+                    expanded_lists[c_name_upper] = expanded
+                target_spaces = expanded_lists[c_name_upper]
 
             # D. Assigned to ZONE -> Find all spaces within that zone
             else:
@@ -265,12 +316,12 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
             for s_name, z_name in target_spaces:
                 # In modern E+, internal objects are named "SpaceName PeopleName"
                 full_key = f"{s_name} {p_name}"
-                targets.append({
-                    'df_key': full_key,
-                    'ems_suffix': _sanitize_ems_name(f"{s_name}_{p_name}"),
-                    'sensor_key': full_key,
-                    'zone_name': z_name  # Important: Actuators act on the Zone Schedule
-                })
+                targets.append(_Target(
+                    df_key=full_key,
+                    ems_suffix=_sanitize_ems_name(f"{s_name}_{p_name}"),
+                    sensor_key=full_key,
+                    zone_name=z_name  # Important: Actuators act on the Zone Schedule
+                ))
 
         # ======================================================================
         # LEVEL 2: ZONELIST (Only if not Space/SpaceList)
@@ -279,16 +330,16 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
             # Assigned to ZONELIST -> Expand to individual Zones
             # E+ creates internal objects named "ZoneName PeopleName"
             zl_obj = zone_lists[c_name_upper]
-            z_names = get_items_from_list(zl_obj, "Zone")
+            z_names = _get_list_items(zl_obj, "Zone")
 
             for z in z_names:
                 full_key = f"{z} {p_name}"
-                targets.append({
-                    'df_key': full_key,
-                    'ems_suffix': _sanitize_ems_name(f"{z}_{p_name}"),
-                    'sensor_key': full_key,
-                    'zone_name': z
-                })
+                targets.append(_Target(
+                    df_key=full_key,
+                    ems_suffix=_sanitize_ems_name(f"{z}_{p_name}"),
+                    sensor_key=full_key,
+                    zone_name=z
+                ))
 
         # ======================================================================
         # LEVEL 3: ZONE (Default/Legacy)
@@ -296,12 +347,12 @@ def _resolve_targets(building: IDF) -> List[Dict[str, str]]:
         else:
             # Assigned directly to ZONE (and no spaces involved).
             # E+ does NOT rename the People object internally.
-            targets.append({
-                'df_key': container_name,  # User identifies by Zone Name
-                'ems_suffix': _sanitize_ems_name(container_name),
-                'sensor_key': p_name,  # Sensor must point to the original People Name
-                'zone_name': container_name
-            })
+            targets.append(_Target(
+                df_key=container_name,  # User identifies by Zone Name
+                ems_suffix=_sanitize_ems_name(container_name),
+                sensor_key=p_name,  # Sensor must point to the original People Name
+                zone_name=container_name
+            ))
 
     return targets
 
@@ -379,14 +430,18 @@ def apply_apmv_setpoints(
     # - ems_sensor_keys: The exact keys to read data from EnergyPlus (e.g., "Space1 People1").
     # - df_keys: Keys used to map user input arguments (e.g., "Space1 People1").
     # - target_zones: The raw Zone names associated with each target.
-    ems_target_suffixes = [t['ems_suffix'] for t in target_data]
-    ems_sensor_keys = [t['sensor_key'] for t in target_data]
-    df_keys = [t['df_key'] for t in target_data]
-    target_zones = [t['zone_name'] for t in target_data]
+    # All four are filled in a single pass over the targets.
+    ems_target_suffixes, ems_sensor_keys, df_keys, target_zones = [], [], [], []
+    for t in target_data:
+        ems_target_suffixes.append(t.ems_suffix)
+        ems_sensor_keys.append(t.sensor_key)
+        df_keys.append(t.df_key)
+        target_zones.append(t.zone_name)
 
     # Get a unique list of zones. This is crucial because Schedules and Thermostats
     # are assigned at the Zone level, even if we calculate comfort at the Space level.
-    unique_zones = list(set(target_zones))
+    # dict.fromkeys keeps the order of first appearance, so the generated IDF is reproducible.
+    unique_zones = list(dict.fromkeys(target_zones))
 
     # --- 2. PREPARE DATA ---
     # Convert date strings (e.g., "01/05") to Day of Year integers (e.g., 121) if necessary.
@@ -471,24 +526,26 @@ def _ensure_infrastructure(building: IDF, unique_zones: List[str], verbose_mode:
     :param unique_zones: A list of RAW zone names (strings) derived from the targets.
     :param verbose_mode: If True, prints success messages for created objects. Warnings are always printed.
     """
-    # Get list of existing schedules to avoid duplicates
-    sch_comp_objs = [i.Name for i in building.idfobjects['Schedule:Compact']]
+    # Get set of existing schedules to avoid duplicates
+    sch_comp_objs = {i.Name for i in building.idfobjects['Schedule:Compact']}
 
     # 1. Create Schedules (Using RAW Zone Name)
     # These are the "dummy" schedules that EMS will overwrite (Actuate) at every timestep.
     # We create one for Heating (PMV_H_SP) and one for Cooling (PMV_C_SP).
-    for i in ['PMV_H_SP', 'PMV_C_SP']:
+    for i in ('PMV_H_SP', 'PMV_C_SP'):
         for zone in unique_zones:
             sch_name = f'{i}_{zone}'
             if sch_name not in sch_comp_objs:
                 building.newidfobject(
                     'Schedule:Compact',
+                    defaultvalues=False,
                     Name=sch_name,
                     Schedule_Type_Limits_Name="Any Number",
                     Field_1='Through: 12/31',
                     Field_2='For: AllDays',
                     Field_3='Until: 24:00,1'  # Default value (will be overwritten by EMS)
                 )
+                sch_comp_objs.add(sch_name)
                 if verbose_mode:
                     print(f"Added Schedule: {sch_name}")
             else:
@@ -499,37 +556,39 @@ def _ensure_infrastructure(building: IDF, unique_zones: List[str], verbose_mode:
     # We need to ensure every target zone has a thermostat capable of Fanger PMV control.
 
     # Map existing thermostats for quick lookup
-    existing_thermostats = {}
-    for t in building.idfobjects['ZoneControl:Thermostat']:
-        existing_thermostats[t.Zone_or_ZoneList_Name.upper()] = t
+    existing_thermostats = {t.Zone_or_ZoneList_Name.upper(): t for t in building.idfobjects['ZoneControl:Thermostat']}
+    existing_tc_thermostats = {
+        t.Zone_or_ZoneList_Name.upper(): t for t in building.idfobjects['ZoneControl:Thermostat:ThermalComfort']
+    }
 
-    existing_tc_thermostats = {}
-    for t in building.idfobjects['ZoneControl:Thermostat:ThermalComfort']:
-        existing_tc_thermostats[t.Zone_or_ZoneList_Name.upper()] = t
+    # Map existing Fanger DualSetpoint objects by name (updated as new ones are created)
+    fanger_objs = {f.Name: f for f in building.idfobjects['ThermostatSetpoint:ThermalComfort:Fanger:DualSetpoint']}
+
+    # Standard thermostats replaced in Case B are collected and removed once after the loop.
+    replaced_thermostats = []
 
     for zone in unique_zones:
         z_upper = zone.upper()
+        # Each map is looked up once per zone; the case is decided from the results.
+        tc_t = existing_tc_thermostats.get(z_upper)
 
-        # Case A: No thermostat exists at all.
-        # Action: Create a new Thermal Comfort Thermostat.
-        if z_upper not in existing_thermostats and z_upper not in existing_tc_thermostats:
-            _create_tc_thermostat(building, zone, verbose_mode)
-
-        # Case B: A Standard Thermostat exists (e.g., DualSetpoint).
-        # Action: Remove the old standard thermostat and replace it with a Thermal Comfort one.
-        # We replace it because a zone cannot have two active thermostat objects.
-        elif z_upper in existing_thermostats and z_upper not in existing_tc_thermostats:
-            old_t = existing_thermostats[z_upper]
-            building.removeidfobject(old_t)
-            if verbose_mode:
-                print(f"Removed existing Standard Thermostat for zone: {zone}")
-            _create_tc_thermostat(building, zone, verbose_mode)
+        if tc_t is None:
+            old_t = existing_thermostats.get(z_upper)
+
+            # Case B: A Standard Thermostat exists (e.g., DualSetpoint).
+            # Action: Remove the old standard thermostat and replace it with a Thermal Comfort one.
+            # We replace it because a zone cannot have two active thermostat objects.
+            if old_t is not None:
+                replaced_thermostats.append(old_t)
+
+            # Case A: No thermostat exists at all (or it is being replaced in Case B).
+            # Action: Create a new Thermal Comfort Thermostat.
+            _create_tc_thermostat(building, zone, sch_comp_objs, fanger_objs, verbose_mode)
 
         # Case C: A Thermal Comfort Thermostat already exists.
         # Action: Ensure it points to a Fanger DualSetpoint object and update that object
         # to use our new EMS-controlled schedules.
-        elif z_upper in existing_tc_thermostats:
-            tc_t = existing_tc_thermostats[z_upper]
+        else:
             # Warning is issued regardless of verbose_mode
             warnings.warn(f"Thermal Comfort Thermostat already exists for zone '{zone}'. Updating configuration.")
 
@@ -539,28 +598,37 @@ def _ensure_infrastructure(building: IDF, unique_zones: List[str], verbose_mode:
                 tc_t.Thermal_Comfort_Control_1_Name = f'Fanger Setpoint {zone}'
 
             # Update the referenced Fanger object
-            _update_fanger_object(building, f'Fanger Setpoint {zone}', zone, verbose_mode)
+            _update_fanger_object(building, f'Fanger Setpoint {zone}', zone, fanger_objs, verbose_mode)
+
+    for old_t in replaced_thermostats:
+        building.removeidfobject(old_t)
+        if verbose_mode:
+            print(f"Removed existing Standard Thermostat for zone: {old_t.Zone_or_ZoneList_Name}")
 
 
-def _create_tc_thermostat(building: IDF, zone: str, verbose_mode: bool):
+def _create_tc_thermostat(building: IDF, zone: str, sch_comp_objs: Set[str], fanger_objs: Dict[str, Any], verbose_mode: bool):
     """
     Creates a new ZoneControl:Thermostat:ThermalComfort object and its dependencies.
 
     :param building: The BESOS/eppy IDF object.
     :param zone: The RAW zone name.
+    :param sch_comp_objs: Names of the existing Schedule:Compact objects (updated in place).
+    :param fanger_objs: Existing Fanger DualSetpoint objects keyed by name.
     :param verbose_mode: If True, prints success messages.
     """
     # 1. Create the Control Type Schedule (Type 4 = Thermal Comfort)
     sch_name = f'Thermal Comfort Control Type Schedule Name {zone}'
-    if not any(s.Name == sch_name for s in building.idfobjects['Schedule:Compact']):
+    if sch_name not in sch_comp_objs:
         building.newidfobject(
             'Schedule:Compact',
+            defaultvalues=False,
             Name=sch_name,
             Schedule_Type_Limits_Name="Any Number",
             Field_1='Through: 12/31',
             Field_2='For: AllDays',
             Field_3='Until: 24:00,4'  # 4 maps to 'Thermal Comfort' control type in E+
         )
+        sch_comp_objs.add(sch_name)
         if verbose_mode:
             print(f"Added Control Type Schedule: {sch_name}")
 
@@ -577,10 +645,10 @@ def _create_tc_thermostat(building: IDF, zone: str, verbose_mode: bool):
         print(f"Added Thermal Comfort Thermostat for zone: {zone}")
 
     # 3. Create the Fanger Setpoint object
-    _update_fanger_object(building, f'Fanger Setpoint {zone}', zone, verbose_mode)
+    _update_fanger_object(building, f'Fanger Setpoint {zone}', zone, fanger_objs, verbose_mode)
 
 
-def _update_fanger_object(building: IDF, obj_name: str, zone: str, verbose_mode: bool):
+def _update_fanger_object(building: IDF, obj_name: str, zone: str, fanger_objs: Dict[str, Any], verbose_mode: bool):
     """
     Creates or updates the 'ThermostatSetpoint:ThermalComfort:Fanger:DualSetpoint' object.
     This object links the thermostat logic to the specific Heating/Cooling schedules.
@@ -588,14 +656,11 @@ def _update_fanger_object(building: IDF, obj_name: str, zone: str, verbose_mode:
     :param building: The BESOS/eppy IDF object.
     :param obj_name: Name of the Fanger object.
     :param zone: The RAW zone name used to find the correct schedules.
+    :param fanger_objs: Existing Fanger DualSetpoint objects keyed by name. New objects are added to it.
     :param verbose_mode: If True, prints success messages.
     """
     # Check if the object already exists
-    fanger_obj = None
-    for f in building.idfobjects['ThermostatSetpoint:ThermalComfort:Fanger:DualSetpoint']:
-        if f.Name == obj_name:
-            fanger_obj = f
-            break
+    fanger_obj = fanger_objs.get(obj_name)
 
     # If not, create it
     if not fanger_obj:
@@ -603,6 +668,7 @@ def _update_fanger_object(building: IDF, obj_name: str, zone: str, verbose_mode:
             'ThermostatSetpoint:ThermalComfort:Fanger:DualSetpoint',
             Name=obj_name
         )
+        fanger_objs[obj_name] = fanger_obj
         if verbose_mode:
             print(f"Added Fanger DualSetpoint Object: {obj_name}")
 
@@ -615,6 +681,124 @@ def _update_fanger_object(building: IDF, obj_name: str, zone: str, verbose_mode:
 # EMS GENERATORS
 # ==============================================================================
 
+# Erl code of the building-wide season program.
+_SET_COOLING_SEASON_LINES = (
+    'if CoolSeasonEnd > CoolSeasonStart',  # Normal case (e.g., May to Sept)
+    'if (DayOfYear >= CoolSeasonStart) && (DayOfYear < CoolSeasonEnd)',
+    'set CoolingSeason = 1',
+    'else',
+    'set CoolingSeason = 0',
+    'endif',
+    'elseif CoolSeasonStart > CoolSeasonEnd',  # Cross-year case (e.g., Dec to Feb)
+    'if (DayOfYear >= CoolSeasonStart) || (DayOfYear < CoolSeasonEnd)',
+    'set CoolingSeason = 1',
+    'else',
+    'set CoolingSeason = 0',
+    'endif',
+    'endif',
+)
+
+# Erl templates for the per-target programs. '{s}' is replaced by the sanitized
+# EMS suffix of each target (e.g., "Space1_People1"). Templates that only contain '{s}'
+# are rendered with a plain str.replace; the remaining fields of _SET_ZONE_INPUT_DATA_LINES
+# are filled with str.format from the target's row of df_arguments.
+_SET_ZONE_INPUT_DATA_LINES = (
+    'set adap_coeff_cooling_{s} = {adap_coeff_cooling}',
+    'set adap_coeff_heating_{s} = {adap_coeff_heating}',
+    'set pmv_cooling_sp_{s} = {pmv_cooling_sp}',
+    'set pmv_heating_sp_{s} = {pmv_heating_sp}',
+    'set tolerance_cooling_sp_cooling_season_{s} = {tolerance_cooling_sp_cooling_season}',
+    'set tolerance_cooling_sp_heating_season_{s} = {tolerance_cooling_sp_heating_season}',
+    'set tolerance_heating_sp_cooling_season_{s} = {tolerance_heating_sp_cooling_season}',
+    'set tolerance_heating_sp_heating_season_{s} = {tolerance_heating_sp_heating_season}',
+)
+
+_APPLY_APMV_LINES = (
+    # 1. Select coefficients based on season
+    'if CoolingSeason == 1',
+    'set adap_coeff_{s} = adap_coeff_cooling_{s}',
+    'set tolerance_cooling_sp_{s} = tolerance_cooling_sp_cooling_season_{s}',
+    'set tolerance_heating_sp_{s} = tolerance_heating_sp_cooling_season_{s}',
+    'elseif CoolingSeason == 0',
+    'set adap_coeff_{s} = adap_coeff_heating_{s}',
+    'set tolerance_cooling_sp_{s} = tolerance_cooling_sp_heating_season_{s}',
+    'set tolerance_heating_sp_{s} = tolerance_heating_sp_heating_season_{s}',
+    'endif',
+
+    # 2. Calculate aPMV Setpoints (Inverse aPMV formula)
+    'set aPMV_H_SP_noTol_{s} = pmv_heating_sp_{s}/(1+adap_coeff_{s}*pmv_heating_sp_{s})',
+    'set aPMV_C_SP_noTol_{s} = pmv_cooling_sp_{s}/(1+adap_coeff_{s}*pmv_cooling_sp_{s})',
+
+    # 3. Apply Tolerance
+    'set aPMV_H_SP_{s} = aPMV_H_SP_noTol_{s}+tolerance_heating_sp_{s}',
+    'set aPMV_C_SP_{s} = aPMV_C_SP_noTol_{s}+tolerance_cooling_sp_{s}',
+
+    # 4. Actuate Schedules (Only if occupied)
+    'if People_Occupant_Count_{s} > 0',
+    # Heating Logic (PMV_H_SP_act is the actuator for the Heating Schedule)
+    'if aPMV_H_SP_{s} < 0',
+    'set PMV_H_SP_act_{s} = aPMV_H_SP_{s}',
+    'else',
+    'set PMV_H_SP_act_{s} = 0',
+    'endif',
+
+    # Cooling Logic (PMV_C_SP_act is the actuator for the Cooling Schedule)
+    'if aPMV_C_SP_{s} > 0',
+    'set PMV_C_SP_act_{s} = aPMV_C_SP_{s}',
+    'else',
+    'set PMV_C_SP_act_{s} = 0',
+    'endif',
+
+    # 5. Unoccupied Logic
+    'else',
+    'set PMV_H_SP_act_{s} = -100',
+    'set PMV_C_SP_act_{s} = 100',
+    'endif',
+)
+
+_MONITOR_APMV_LINES = (
+    'set aPMV_{s} = PMV_{s}/(1+adap_coeff_{s}*PMV_{s})',
+)
+
+_COUNT_APMV_COMFORT_HOURS_LINES = (
+    'if aPMV_{s} < aPMV_H_SP_noTol_{s}',
+    'set comfhour_{s} = 0',
+    'set discomfhour_cold_{s} = 1*ZoneTimeStep',
+    'set discomfhour_heat_{s} = 0',
+    'elseif aPMV_{s} > aPMV_C_SP_noTol_{s}',
+    'set comfhour_{s} = 0',
+    'set discomfhour_cold_{s} = 0',
+    'set discomfhour_heat_{s} = 1*ZoneTimeStep',
+    'else',
+    'set comfhour_{s} = 1*ZoneTimeStep',
+    'set discomfhour_cold_{s} = 0',
+    'set discomfhour_heat_{s} = 0',
+    'endif',
+    'if People_Occupant_Count_{s} > 0',
+    'set occupied_hour_{s} = 1*ZoneTimeStep',
+    'else',
+    'set occupied_hour_{s} = 0',
+    'endif',
+    'set discomfhour_{s} = discomfhour_cold_{s} + discomfhour_heat_{s}',
+)
+
+
+def _new_ems_program(building: IDF, name: str, lines: Iterable[str]):
+    """
+    Creates an EnergyManagementSystem:Program and fills its Program_Line_<n> fields
+    from a flat sequence of Erl lines.
+
+    :param building: The BESOS/eppy IDF object.
+    :param name: Name of the program.
+    :param lines: Erl lines in execution order.
+    :return: The new EnergyManagementSystem:Program object.
+    """
+    program = building.newidfobject('EnergyManagementSystem:Program', defaultvalues=False, Name=name)
+    for n, line in enumerate(lines, 1):
+        program[f'Program_Line_{n}'] = line
+    return program
+
+
 def _add_apmv_sensors(building: IDF, sensor_keys: List[str], suffixes: List[str], verbose_mode: bool):
     """
     Adds EnergyManagementSystem:Sensor objects to the IDF.
@@ -630,39 +814,43 @@ def _add_apmv_sensors(building: IDF, sensor_keys: List[str], suffixes: List[str]
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
     # Get existing sensors to avoid duplicates
-    sensornamelist = [s.Name for s in building.idfobjects['EnergyManagementSystem:Sensor']]
+    sensornamelist = {s.Name for s in building.idfobjects['EnergyManagementSystem:Sensor']}
 
-    for i in range(len(suffixes)):
+    for sensor_key, suffix in zip(sensor_keys, suffixes):
         # 1. PMV Sensor
-        pmv_sensor_name = f'PMV_{suffixes[i]}'
+        pmv_sensor_name = f'PMV_{suffix}'
         if pmv_sensor_name not in sensornamelist:
             building.newidfobject(
                 'EnergyManagementSystem:Sensor',
+                defaultvalues=False,
                 Name=pmv_sensor_name,
-                OutputVariable_or_OutputMeter_Index_Key_Name=sensor_keys[i],
+                OutputVariable_or_OutputMeter_Index_Key_Name=sensor_key,
                 OutputVariable_or_OutputMeter_Name='Zone Thermal Comfort Fanger Model PMV'
             )
+            sensornamelist.add(pmv_sensor_name)
             if verbose_mode:
                 print(f"Added Sensor: {pmv_sensor_name}")
         else:
             warnings.warn(f"Sensor '{pmv_sensor_name}' already exists. Skipping.")
 
         # 2. Occupant Count Sensor
-        occ_sensor_name = f'People_Occupant_Count_{suffixes[i]}'
+        occ_sensor_name = f'People_Occupant_Count_{suffix}'
         if occ_sensor_name not in sensornamelist:
             building.newidfobject(
                 'EnergyManagementSystem:Sensor',
+                defaultvalues=False,
                 Name=occ_sensor_name,
-                OutputVariable_or_OutputMeter_Index_Key_Name=sensor_keys[i],
+                OutputVariable_or_OutputMeter_Index_Key_Name=sensor_key,
                 OutputVariable_or_OutputMeter_Name='People Occupant Count'
             )
+            sensornamelist.add(occ_sensor_name)
             if verbose_mode:
                 print(f"Added Sensor: {occ_sensor_name}")
         else:
             warnings.warn(f"Sensor '{occ_sensor_name}' already exists. Skipping.")
 
 
-def _add_apmv_actuators(building: IDF, target_data: List[Dict], verbose_mode: bool):
+def _add_apmv_actuators(building: IDF, target_data: List[_Target], verbose_mode: bool):
     """
     Adds EnergyManagementSystem:Actuator objects.
 
@@ -671,16 +859,16 @@ def _add_apmv_actuators(building: IDF, target_data: List[Dict], verbose_mode: bo
     to overwrite the value of the Schedule:Compact objects created in the infrastructure step.
 
     :param building: The BESOS/eppy IDF object.
-    :param target_data: List of target dictionaries resolved earlier.
+    :param target_data: List of targets resolved earlier.
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
-    actuatornamelist = [actuator.Name for actuator in building.idfobjects['EnergyManagementSystem:Actuator']]
+    actuatornamelist = {actuator.Name for actuator in building.idfobjects['EnergyManagementSystem:Actuator']}
 
     for target in target_data:
-        suffix = target['ems_suffix']  # Sanitized name (e.g., "Space1_People1")
-        zone = target['zone_name']  # Raw name (e.g., "Zone 1")
+        suffix = target.ems_suffix  # Sanitized name (e.g., "Space1_People1")
+        zone = target.zone_name  # Raw name (e.g., "Zone 1")
 
-        for i in ['H', 'C']:
+        for i in ('H', 'C'):
             # Actuator Name: Must be unique and sanitized for EMS.
             # We use the suffix derived from the specific target (Space/People).
             act_name = f'PMV_{i}_SP_act_{suffix}'
@@ -692,12 +880,14 @@ def _add_apmv_actuators(building: IDF, target_data: List[Dict], verbose_mode: bo
             if act_name not in actuatornamelist:
                 building.newidfobject(
                     'EnergyManagementSystem:Actuator',
+                    defaultvalues=False,
                     Name=act_name,
                     # We actuate the 'Schedule Value' of the 'Schedule:Compact' object
                     Actuated_Component_Unique_Name=sch_name,
                     Actuated_Component_Type='Schedule:Compact',
                     Actuated_Component_Control_Type='Schedule Value',
                 )
+                actuatornamelist.add(act_name)
                 if verbose_mode:
                     print(f"Added Actuator: {act_name}")
             else:
@@ -726,26 +916,20 @@ def _add_apmv_global_variables(building: IDF, suffixes: List[str], verbose_mode:
 
     existing = {gv.Erl_Variable_1_Name for gv in building.idfobjects['EnergyManagementSystem:GlobalVariable']}
 
-    # 1. Global Season Variables (Shared across the whole building)
-    for gv in ['CoolingSeason', 'CoolSeasonEnd', 'CoolSeasonStart']:
+    # 1. Global Season Variables (Shared across the whole building), followed by
+    # 2. Per-Target Variables (Specific to each Zone/Space)
+    gv_names = ['CoolingSeason', 'CoolSeasonEnd', 'CoolSeasonStart']
+    gv_names.extend(f'{prefix}_{suffix}' for prefix, suffix in product(prefixes, suffixes))
+
+    for gv in gv_names:
         if gv not in existing:
-            building.newidfobject('EnergyManagementSystem:GlobalVariable', Erl_Variable_1_Name=gv)
+            building.newidfobject('EnergyManagementSystem:GlobalVariable', defaultvalues=False, Erl_Variable_1_Name=gv)
+            existing.add(gv)
             if verbose_mode:
                 print(f"Added Global Variable: {gv}")
         else:
             warnings.warn(f"Global Variable '{gv}' already exists. Skipping.")
 
-    # 2. Per-Target Variables (Specific to each Zone/Space)
-    for prefix in prefixes:
-        for suffix in suffixes:
-            gv = f'{prefix}_{suffix}'
-            if gv not in existing:
-                building.newidfobject('EnergyManagementSystem:GlobalVariable', Erl_Variable_1_Name=gv)
-                if verbose_mode:
-                    print(f"Added Global Variable: {gv}")
-            else:
-                warnings.warn(f"Global Variable '{gv}' already exists. Skipping.")
-
 
 def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.DataFrame, cool_start: int, cool_end: int, verbose_mode: bool):
     """
@@ -759,14 +943,20 @@ def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.Data
     :param cool_end: Integer representing the end day of cooling season.
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
-    programlist = [p.Name for p in building.idfobjects['EnergyManagementSystem:Program']]
+    programlist = {p.Name for p in building.idfobjects['EnergyManagementSystem:Program']}
+
+    # Convert the arguments to plain dictionaries once and key them by EMS suffix,
+    # so that each target below finds its row with a single dict lookup instead of
+    # a boolean-mask scan of the DataFrame. The first row wins for duplicate suffixes.
+    rows_by_suffix = {}
+    for row in df_arguments.to_dict(orient='records'):
+        rows_by_suffix.setdefault(row['underscore_zonename'], row)
 
     # --- PROGRAM 1: Initialize Season Dates ---
     prog_name = 'set_cooling_season_input_data'
     if prog_name not in programlist:
-        building.newidfobject('EnergyManagementSystem:Program', Name=prog_name,
-                              Program_Line_1=f'set CoolSeasonStart = {cool_start}',
-                              Program_Line_2=f'set CoolSeasonEnd = {cool_end}')
+        _new_ems_program(building, prog_name, (f'set CoolSeasonStart = {cool_start}', f'set CoolSeasonEnd = {cool_end}'))
+        programlist.add(prog_name)
         if verbose_mode: print(f"Added Program: {prog_name}")
     else:
         warnings.warn(f"Program '{prog_name}' already exists. Skipping.")
@@ -774,16 +964,8 @@ def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.Data
     # --- PROGRAM 2: Determine Current Season ---
     prog_name = 'set_cooling_season'
     if prog_name not in programlist:
-        building.newidfobject('EnergyManagementSystem:Program', Name=prog_name,
-                              Program_Line_1='if CoolSeasonEnd > CoolSeasonStart',  # Normal case (e.g., May to Sept)
-                              Program_Line_2='if (DayOfYear >= CoolSeasonStart) && (DayOfYear < CoolSeasonEnd)',
-                              Program_Line_3='set CoolingSeason = 1',
-                              Program_Line_4='else', Program_Line_5='set CoolingSeason = 0', Program_Line_6='endif',
-                              Program_Line_7='elseif CoolSeasonStart > CoolSeasonEnd',  # Cross-year case (e.g., Dec to Feb)
-                              Program_Line_8='if (DayOfYear >= CoolSeasonStart) || (DayOfYear < CoolSeasonEnd)',
-                              Program_Line_9='set CoolingSeason = 1',
-                              Program_Line_10='else', Program_Line_11='set CoolingSeason = 0', Program_Line_12='endif',
-                              Program_Line_13='endif')
+        _new_ems_program(building, prog_name, _SET_COOLING_SEASON_LINES)
+        programlist.add(prog_name)
         if verbose_mode: print(f"Added Program: {prog_name}")
     else:
         warnings.warn(f"Program '{prog_name}' already exists. Skipping.")
@@ -791,23 +973,15 @@ def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.Data
     # --- PER-TARGET PROGRAMS ---
     for suffix in suffixes:
         # Retrieve parameters for this specific target from the DataFrame
-        try:
-            row_idx = df_arguments[df_arguments['underscore_zonename'] == suffix].index[0]
-        except IndexError:
+        row = rows_by_suffix.get(suffix)
+        if row is None:
             continue  # Skip if data not found
 
         # --- PROGRAM 3: Initialize Zone Parameters ---
         prog_name = f'set_zone_input_data_{suffix}'
         if prog_name not in programlist:
-            building.newidfobject('EnergyManagementSystem:Program', Name=prog_name,
-                                  Program_Line_1=f'set adap_coeff_cooling_{suffix} = {df_arguments.loc[row_idx, "adap_coeff_cooling"]}',
-                                  Program_Line_2=f'set adap_coeff_heating_{suffix} = {df_arguments.loc[row_idx, "adap_coeff_heating"]}',
-                                  Program_Line_3=f'set pmv_cooling_sp_{suffix} = {df_arguments.loc[row_idx, "pmv_cooling_sp"]}',
-                                  Program_Line_4=f'set pmv_heating_sp_{suffix} = {df_arguments.loc[row_idx, "pmv_heating_sp"]}',
-                                  Program_Line_5=f'set tolerance_cooling_sp_cooling_season_{suffix} = {df_arguments.loc[row_idx, "tolerance_cooling_sp_cooling_season"]}',
-                                  Program_Line_6=f'set tolerance_cooling_sp_heating_season_{suffix} = {df_arguments.loc[row_idx, "tolerance_cooling_sp_heating_season"]}',
-                                  Program_Line_7=f'set tolerance_heating_sp_cooling_season_{suffix} = {df_arguments.loc[row_idx, "tolerance_heating_sp_cooling_season"]}',
-                                  Program_Line_8=f'set tolerance_heating_sp_heating_season_{suffix} = {df_arguments.loc[row_idx, "tolerance_heating_sp_heating_season"]}')
+            _new_ems_program(building, prog_name, (line.format(s=suffix, **row) for line in _SET_ZONE_INPUT_DATA_LINES))
+            programlist.add(prog_name)
             if verbose_mode: print(f"Added Program: {prog_name}")
         else:
             warnings.warn(f"Program '{prog_name}' already exists. Skipping.")
@@ -815,50 +989,8 @@ def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.Data
         # --- PROGRAM 4: Apply aPMV Logic (The Core Logic) ---
         prog_name = f'apply_aPMV_{suffix}'
         if prog_name not in programlist:
-            act_h = f'PMV_H_SP_act_{suffix}'  # Actuator for Heating Schedule
-            act_c = f'PMV_C_SP_act_{suffix}'  # Actuator for Cooling Schedule
-
-            building.newidfobject('EnergyManagementSystem:Program', Name=prog_name,
-                                  # 1. Select coefficients based on season
-                                  Program_Line_1='if CoolingSeason == 1',
-                                  Program_Line_2=f'set adap_coeff_{suffix} = adap_coeff_cooling_{suffix}',
-                                  Program_Line_3=f'set tolerance_cooling_sp_{suffix} = tolerance_cooling_sp_cooling_season_{suffix}',
-                                  Program_Line_4=f'set tolerance_heating_sp_{suffix} = tolerance_heating_sp_cooling_season_{suffix}',
-                                  Program_Line_5='elseif CoolingSeason == 0',
-                                  Program_Line_6=f'set adap_coeff_{suffix} = adap_coeff_heating_{suffix}',
-                                  Program_Line_7=f'set tolerance_cooling_sp_{suffix} = tolerance_cooling_sp_heating_season_{suffix}',
-                                  Program_Line_8=f'set tolerance_heating_sp_{suffix} = tolerance_heating_sp_heating_season_{suffix}',
-                                  Program_Line_9='endif',
-
-                                  # 2. Calculate aPMV Setpoints (Inverse aPMV formula)
-                                  Program_Line_10=f'set aPMV_H_SP_noTol_{suffix} = pmv_heating_sp_{suffix}/(1+adap_coeff_{suffix}*pmv_heating_sp_{suffix})',
-                                  Program_Line_11=f'set aPMV_C_SP_noTol_{suffix} = pmv_cooling_sp_{suffix}/(1+adap_coeff_{suffix}*pmv_cooling_sp_{suffix})',
-
-                                  # 3. Apply Tolerance
-                                  Program_Line_12=f'set aPMV_H_SP_{suffix} = aPMV_H_SP_noTol_{suffix}+tolerance_heating_sp_{suffix}',
-                                  Program_Line_13=f'set aPMV_C_SP_{suffix} = aPMV_C_SP_noTol_{suffix}+tolerance_cooling_sp_{suffix}',
-
-                                  # 4. Actuate Schedules (Only if occupied)
-                                  Program_Line_14=f'if People_Occupant_Count_{suffix} > 0',
-                                  # Heating Logic
-                                  Program_Line_15=f'if aPMV_H_SP_{suffix} < 0',
-                                  Program_Line_16=f'set {act_h} = aPMV_H_SP_{suffix}',
-                                  Program_Line_17='else',
-                                  Program_Line_18=f'set {act_h} = 0',
-                                  Program_Line_19='endif',
-
-                                  # Cooling Logic
-                                  Program_Line_20=f'if aPMV_C_SP_{suffix} > 0',
-                                  Program_Line_21=f'set {act_c} = aPMV_C_SP_{suffix}',
-                                  Program_Line_22='else',
-                                  Program_Line_23=f'set {act_c} = 0',
-                                  Program_Line_24='endif',
-
-                                  # 5. Unoccupied Logic
-                                  Program_Line_25='else',
-                                  Program_Line_26=f'set {act_h} = -100',
-                                  Program_Line_27=f'set {act_c} = 100',
-                                  Program_Line_28='endif')
+            _new_ems_program(building, prog_name, (line.replace('{s}', suffix) for line in _APPLY_APMV_LINES))
+            programlist.add(prog_name)
             if verbose_mode: print(f"Added Program: {prog_name}")
         else:
             warnings.warn(f"Program '{prog_name}' already exists. Skipping.")
@@ -866,8 +998,8 @@ def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.Data
         # --- PROGRAM 5: Monitor aPMV ---
         prog_name = f'monitor_aPMV_{suffix}'
         if prog_name not in programlist:
-            building.newidfobject('EnergyManagementSystem:Program', Name=prog_name,
-                                  Program_Line_1=f'set aPMV_{suffix} = PMV_{suffix}/(1+adap_coeff_{suffix}*PMV_{suffix})')
+            _new_ems_program(building, prog_name, (line.replace('{s}', suffix) for line in _MONITOR_APMV_LINES))
+            programlist.add(prog_name)
             if verbose_mode: print(f"Added Program: {prog_name}")
         else:
             warnings.warn(f"Program '{prog_name}' already exists. Skipping.")
@@ -875,24 +1007,8 @@ def _add_apmv_programs(building: IDF, suffixes: List[str], df_arguments: pd.Data
         # --- PROGRAM 6: Count Comfort Hours ---
         prog_name = f'count_aPMV_comfort_hours_{suffix}'
         if prog_name not in programlist:
-            building.newidfobject('EnergyManagementSystem:Program', Name=prog_name,
-                                  Program_Line_1=f'if aPMV_{suffix} < aPMV_H_SP_noTol_{suffix}',
-                                  Program_Line_2=f'set comfhour_{suffix} = 0',
-                                  Program_Line_3=f'set discomfhour_cold_{suffix} = 1*ZoneTimeStep',
-                                  Program_Line_4=f'set discomfhour_heat_{suffix} = 0',
-                                  Program_Line_5=f'elseif aPMV_{suffix} > aPMV_C_SP_noTol_{suffix}',
-                                  Program_Line_6=f'set comfhour_{suffix} = 0',
-                                  Program_Line_7=f'set discomfhour_cold_{suffix} = 0',
-                                  Program_Line_8=f'set discomfhour_heat_{suffix} = 1*ZoneTimeStep',
-                                  Program_Line_9='else',
-                                  Program_Line_10=f'set comfhour_{suffix} = 1*ZoneTimeStep',
-                                  Program_Line_11=f'set discomfhour_cold_{suffix} = 0',
-                                  Program_Line_12=f'set discomfhour_heat_{suffix} = 0',
-                                  Program_Line_13='endif',
-                                  Program_Line_14=f'if People_Occupant_Count_{suffix} > 0',
-                                  Program_Line_15=f'set occupied_hour_{suffix} = 1*ZoneTimeStep',
-                                  Program_Line_16='else', Program_Line_17=f'set occupied_hour_{suffix} = 0', Program_Line_18='endif',
-                                  Program_Line_19=f'set discomfhour_{suffix} = discomfhour_cold_{suffix} + discomfhour_heat_{suffix}')
+            _new_ems_program(building, prog_name, (line.replace('{s}', suffix) for line in _COUNT_APMV_COMFORT_HOURS_LINES))
+            programlist.add(prog_name)
             if verbose_mode: print(f"Added Program: {prog_name}")
         else:
             warnings.warn(f"Program '{prog_name}' already exists. Skipping.")
@@ -907,12 +1023,13 @@ def _add_apmv_program_calling_managers(building: IDF, verbose_mode: bool):
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
     programlist = [p.Name for p in building.idfobjects['EnergyManagementSystem:Program']]
-    pcmlist = [pcm.Name for pcm in building.idfobjects['EnergyManagementSystem:ProgramCallingManager']]
+    pcmlist = {pcm.Name for pcm in building.idfobjects['EnergyManagementSystem:ProgramCallingManager']}
 
     for prog in programlist:
         if prog not in pcmlist:
-            building.newidfobject('EnergyManagementSystem:ProgramCallingManager', Name=prog,
+            building.newidfobject('EnergyManagementSystem:ProgramCallingManager', defaultvalues=False, Name=prog,
                                   EnergyPlus_Model_Calling_Point="BeginTimestepBeforePredictor", Program_Name_1=prog)
+            pcmlist.add(prog)
             if verbose_mode: print(f"Added ProgramCallingManager for: {prog}")
         else:
             warnings.warn(f"ProgramCallingManager for '{prog}' already exists. Skipping.")
@@ -929,7 +1046,10 @@ def _add_apmv_outputs(building: IDF, outputs_freq: List[str], other_PMV_related_
     :param unique_zones: List of RAW zone names for Schedule outputs.
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
-    outputvariablelist = [v.Name for v in building.idfobjects['EnergyManagementSystem:OutputVariable']]
+    # Names of all EMS output variables in model order (existing ones first, then the ones added below),
+    # plus a set of the same names for membership checks.
+    ems_output_names = [v.Name for v in building.idfobjects['EnergyManagementSystem:OutputVariable']]
+    outputvariablelist = set(ems_output_names)
 
     # 1. Define EMS Output Variables (Mapping internal vars to output names)
     EMSOutputVariableZone_dict = {
@@ -946,76 +1066,94 @@ def _add_apmv_outputs(building: IDF, outputs_freq: List[str], other_PMV_related_
         'Occupied hours': ['occupied_hour', 'H', 'Summed'],
     }
 
-    for key, val in EMSOutputVariableZone_dict.items():
-        for suffix in suffixes:
-            out_name = f'{key}_{suffix}'
-            if out_name not in outputvariablelist:
-                building.newidfobject('EnergyManagementSystem:OutputVariable', Name=out_name,
-                                      EMS_Variable_Name=f'{val[0]}_{suffix}', Type_of_Data_in_Variable=val[2],
-                                      Update_Frequency='ZoneTimestep', Units=val[1])
-                if verbose_mode: print(f"Added EMS Output Variable: {out_name}")
-            else:
-                warnings.warn(f"EMS Output Variable '{out_name}' already exists. Skipping.")
+    for (key, (ems_var, units, data_type)), suffix in product(EMSOutputVariableZone_dict.items(), suffixes):
+        out_name = f'{key}_{suffix}'
+        if out_name not in outputvariablelist:
+            building.newidfobject('EnergyManagementSystem:OutputVariable', defaultvalues=False, Name=out_name,
+                                  EMS_Variable_Name=f'{ems_var}_{suffix}', Type_of_Data_in_Variable=data_type,
+                                  Update_Frequency='ZoneTimestep', Units=units)
+            outputvariablelist.add(out_name)
+            ems_output_names.append(out_name)
+            if verbose_mode: print(f"Added EMS Output Variable: {out_name}")
+        else:
+            warnings.warn(f"EMS Output Variable '{out_name}' already exists. Skipping.")
 
     # 2. Add Standard Output:Variables for reporting
+    # Map each reporting frequency to the names already requested at that frequency,
+    # so that the existing Output:Variable objects are scanned only once.
+    # Keyed outputs (e.g. Schedule Value of a given schedule) are tracked as (Key_Value, Variable_Name) pairs.
+    outputs_by_freq = {}
+    keyed_outputs_by_freq = {}
+    for o in building.idfobjects['Output:Variable']:
+        outputs_by_freq.setdefault(o.Reporting_Frequency, set()).add(o.Variable_Name)
+        keyed_outputs_by_freq.setdefault(o.Reporting_Frequency, set()).add((o.Key_Value, o.Variable_Name))
+
+    # Setpoint schedule names do not depend on the frequency, so build them once.
+    schedule_names = [f'{i}_{zone}' for i in ('PMV_H_SP', 'PMV_C_SP') for zone in unique_zones]
+
     for freq in outputs_freq:
-        current_outputs = [o.Variable_Name for o in building.idfobjects['Output:Variable'] if o.Reporting_Frequency == freq.capitalize()]
+        freq_cap = freq.capitalize()
+        current_outputs = outputs_by_freq.setdefault(freq_cap, set())
+        current_keyed_outputs = keyed_outputs_by_freq.setdefault(freq_cap, set())
 
         # Add all EMS variables created above
-        for outvar in [v.Name for v in building.idfobjects['EnergyManagementSystem:OutputVariable']]:
+        for outvar in ems_output_names:
             if outvar not in current_outputs and not outvar.startswith("WIP"):
-                building.newidfobject('Output:Variable', Key_Value='*', Variable_Name=outvar, Reporting_Frequency=freq.capitalize())
+                building.newidfobject('Output:Variable', defaultvalues=False, Key_Value='*', Variable_Name=outvar, Reporting_Frequency=freq_cap)
+                current_outputs.add(outvar)
                 if verbose_mode: print(f"Added Output:Variable for {outvar} ({freq})")
 
         # Add Schedule Values (using RAW zone names)
-        sanitized_zones = {z: _sanitize_ems_name(z) for z in unique_zones}
-        for i in ['PMV_H_SP', 'PMV_C_SP']:
-            for zone in unique_zones:
-                sch_name = f'{i}_{zone}'
-                building.newidfobject('Output:Variable', Key_Value=sch_name, Variable_Name='Schedule Value', Reporting_Frequency=freq.capitalize())
-                if verbose_mode: print(f"Added Output:Variable for Schedule {sch_name} ({freq})")
+        for sch_name in schedule_names:
+            if (sch_name, 'Schedule Value') in current_keyed_outputs:
+                continue
+            building.newidfobject('Output:Variable', defaultvalues=False, Key_Value=sch_name, Variable_Name='Schedule Value', Reporting_Frequency=freq_cap)
+            current_keyed_outputs.add((sch_name, 'Schedule Value'))
+            if verbose_mode: print(f"Added Output:Variable for Schedule {sch_name} ({freq})")
 
         # Add additional comfort outputs if requested
         if other_PMV_related_outputs:
             additional = ['Zone Operative Temperature', 'Zone Thermal Comfort Fanger Model PMV', 'Zone Thermal Comfort Fanger Model PPD', 'Zone Mean Air Temperature']
             for item in additional:
                 if item not in current_outputs:
-                    building.newidfobject('Output:Variable', Key_Value='*', Variable_Name=item, Reporting_Frequency=freq.capitalize())
+                    building.newidfobject('Output:Variable', defaultvalues=False, Key_Value='*', Variable_Name=item, Reporting_Frequency=freq_cap)
+                    current_outputs.add(item)
                     if verbose_mode: print(f"Added Output:Variable for {item} ({freq})")
 
-        # 3. Add Output:Meter objects
-        meter_objects = [
-            'EnergyTransfer:HVAC',
-            'Electricity:HVAC'
-        ]
-
-        for freq in outputs_freq:
-            # Get existing meters for this frequency to avoid duplicates
-            # Note: Key_Name is the field for the meter name
-            current_meters = [
-                m.Key_Name for m in building.idfobjects['Output:Meter']
-                if m.Reporting_Frequency.upper() == freq.upper()
-            ]
-
-            for meter in meter_objects:
-                if meter not in current_meters:
-                    building.newidfobject(
-                        'Output:Meter',
-                        Key_Name=meter,
-                        Reporting_Frequency=freq.capitalize()
-                    )
-                    if verbose_mode:
-                        print(f"Added Output:Meter for {meter} ({freq})")
-                else:
-                    warnings.warn(f"Output:Meter '{meter}' ({freq}) already exists. Skipping.")
+    # 3. Add Output:Meter objects
+    meter_objects = [
+        'EnergyTransfer:HVAC',
+        'Electricity:HVAC'
+    ]
+
+    # Get existing meters as (meter name, frequency) pairs to avoid duplicates
+    # Note: Key_Name is the field for the meter name
+    existing_meters = {(m.Key_Name, m.Reporting_Frequency.upper()) for m in building.idfobjects['Output:Meter']}
+
+    for freq in outputs_freq:
+        freq_upper = freq.upper()
+        for meter in meter_objects:
+            if (meter, freq_upper) not in existing_meters:
+                building.newidfobject(
+                    'Output:Meter',
+                    defaultvalues=False,
+                    Key_Name=meter,
+                    Reporting_Frequency=freq.capitalize()
+                )
+                existing_meters.add((meter, freq_upper))
+                if verbose_mode:
+                    print(f"Added Output:Meter for {meter} ({freq})")
+            else:
+                warnings.warn(f"Output:Meter '{meter}' ({freq}) already exists. Skipping.")
 
     # 4. Ensure OutputControl:Files is present
-    if not building.idfobjects['OutputControl:Files']:
+    output_control_files = building.idfobjects['OutputControl:Files']
+    if not output_control_files:
         building.newidfobject('OutputControl:Files', Output_CSV='Yes', Output_MTR='Yes', Output_ESO='Yes')
         if verbose_mode: print("Added OutputControl:Files object")
     else:
         # Update existing object
-        obj = building.idfobjects['OutputControl:Files'][0]
+        obj = output_control_files[0]
         obj.Output_CSV = 'Yes'
         obj.Output_MTR = 'Yes'
         obj.Output_ESO = 'Yes'
@@ -1026,6 +1164,19 @@ def _add_apmv_outputs(building: IDF, outputs_freq: List[str], other_PMV_related_
 # UTILS
 # ==============================================================================
 
+# Parameter columns of the arguments DataFrame, one per user-facing aPMV argument.
+_APMV_ARG_COLUMNS = (
+    'adap_coeff_cooling',
+    'adap_coeff_heating',
+    'pmv_cooling_sp',
+    'pmv_heating_sp',
+    'tolerance_cooling_sp_cooling_season',
+    'tolerance_cooling_sp_heating_season',
+    'tolerance_heating_sp_cooling_season',
+    'tolerance_heating_sp_heating_season',
+)
+
+
 def generate_df_from_args(
         target_keys_input: List[str],
         ems_suffixes: List[str],
@@ -1057,49 +1208,54 @@ def generate_df_from_args(
     :param pmv_*_sp: PMV setpoints for cooling/heating.
     :param tolerance_*: Tolerance bands for different seasons and modes.
     :param dflt_*: Default values to use if a specific key is missing in the dictionary inputs.
-    :return: A pandas DataFrame indexed by target keys, containing all parameters and the 'underscore_zonename'.
+    :return: A pandas DataFrame indexed by the unique target keys (one row per key), containing all parameters and the 'underscore_zonename'.
     """
 
-    space_ppl_names = target_keys_input
+    # Pair each key with its sanitized suffix. Repeated keys (e.g. a Zone holding several
+    # People objects in a legacy model) collapse to a single row, keeping first-appearance order.
+    suffix_map = dict(zip(target_keys_input, ems_suffixes))
+    space_ppl_names = list(suffix_map)
+    # Set of valid keys for O(1) membership checks on dictionary inputs
+    space_ppl_names_set = set(space_ppl_names)
 
     def process_arg(arg_val, arg_name, default_val):
-        """Internal helper to normalize float/dict inputs into a Series."""
-        data = {}
+        """Internal helper to normalize float/dict inputs into a list of values aligned with the targets."""
         if isinstance(arg_val, dict):
             # Validate keys
-            valid_keys = [k for k in arg_val if k in space_ppl_names]
-            dropped = [k for k in arg_val if k not in space_ppl_names]
+            dropped = [k for k in arg_val if k not in space_ppl_names_set]
 
             if dropped:
                 warnings.warn(f"The following keys in '{arg_name}' were not found in the model and will be ignored: {dropped}")
 
             # Fill data, using default if key is missing
-            for k in space_ppl_names:
-                data[k] = arg_val.get(k, default_val)
-        else:
-            # Apply single float value to all targets
-            for k in space_ppl_names:
-                data[k] = arg_val
-        return pd.Series(data, name=arg_name)
-
-    # Process all arguments into Series
-    series_list = [
-        process_arg(adap_coeff_cooling, 'adap_coeff_cooling', dflt_for_adap_coeff_cooling),
-        process_arg(adap_coeff_heating, 'adap_coeff_heating', dflt_for_adap_coeff_heating),
-        process_arg(pmv_cooling_sp, 'pmv_cooling_sp', dflt_for_pmv_cooling_sp),
-        process_arg(pmv_heating_sp, 'pmv_heating_sp', dflt_for_pmv_heating_sp),
-        process_arg(tolerance_cooling_sp_cooling_season, 'tolerance_cooling_sp_cooling_season', dflt_for_tolerance_cooling_sp_cooling_season),
-        process_arg(tolerance_cooling_sp_heating_season, 'tolerance_cooling_sp_heating_season', dflt_for_tolerance_cooling_sp_heating_season),
-        process_arg(tolerance_heating_sp_cooling_season, 'tolerance_heating_sp_cooling_season', dflt_for_tolerance_heating_sp_cooling_season),
-        process_arg(tolerance_heating_sp_heating_season, 'tolerance_heating_sp_heating_season', dflt_for_tolerance_heating_sp_heating_season),
-    ]
+            return [arg_val.get(k, default_val) for k in space_ppl_names]
+        # Apply single float value to all targets
+        return [arg_val] * len(space_ppl_names)
+
+    # Process all arguments into columns, in the order given by _APMV_ARG_COLUMNS
+    user_values = (
+        adap_coeff_cooling, adap_coeff_heating, pmv_cooling_sp, pmv_heating_sp,
+        tolerance_cooling_sp_cooling_season, tolerance_cooling_sp_heating_season,
+        tolerance_heating_sp_cooling_season, tolerance_heating_sp_heating_season,
+    )
+    default_values = (
+        dflt_for_adap_coeff_cooling, dflt_for_adap_coeff_heating, dflt_for_pmv_cooling_sp, dflt_for_pmv_heating_sp,
+        dflt_for_tolerance_cooling_sp_cooling_season, dflt_for_tolerance_cooling_sp_heating_season,
+        dflt_for_tolerance_heating_sp_cooling_season, dflt_for_tolerance_heating_sp_heating_season,
+    )
+    columns = {
+        col: process_arg(arg_val, col, default_val)
+        for col, arg_val, default_val in zip(_APMV_ARG_COLUMNS, user_values, default_values)
+    }
 
-    # Concatenate into a single DataFrame
-    df_arguments = pd.concat(series_list, axis=1)
+    # Build the DataFrame in a single call instead of concatenating one Series per argument.
+    # The columns are already aligned with the index, so pandas does not have to reindex them,
+    # and columns of the same dtype are consolidated into a single block.
+    df_arguments = pd.DataFrame(columns, index=space_ppl_names)
 
-    # Map the sanitized suffixes to the DataFrame for easy access later
-    suffix_map = dict(zip(target_keys_input, ems_suffixes))
-    df_arguments['underscore_zonename'] = df_arguments.index.map(suffix_map)
+    # Attach the sanitized suffixes for easy access later.
+    # They are aligned with the index (the keys of suffix_map), so no key lookup is needed.
+    df_arguments['underscore_zonename'] = list(suffix_map.values())
 
     return df_arguments
 
@@ -1113,7 +1269,7 @@ def get_available_target_names(building: IDF) -> List[str]:
     :return: A list of strings representing the valid keys (e.g., ['Space1 People', 'Space2 People']).
     """
     targets = _resolve_targets(building)
-    return [t['df_key'] for t in targets]
+    return [t.df_key for t in targets]
 
 
 def get_input_template_dictionary(building: IDF) -> Dict[str, str]:
@@ -1136,12 +1292,13 @@ def set_zones_always_occupied(building: IDF, verbose_mode: bool = True):
     :param building: The BESOS/eppy IDF object.
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
-    sch_comp_objs = [i.Name for i in building.idfobjects['schedule:compact']]
+    sch_comp_objs = {i.Name for i in building.idfobjects['schedule:compact']}
 
     # Create 'On' schedule if missing
     if 'On' not in sch_comp_objs:
         building.newidfobject(
             'Schedule:Compact',
+            defaultvalues=False,
             Name='On',
             Schedule_Type_Limits_Name="Any Number",
             Field_1='Through: 12/31',
@@ -1154,7 +1311,8 @@ def set_zones_always_occupied(building: IDF, verbose_mode: bool = True):
         warnings.warn("Schedule 'On' already exists. Using existing schedule.")
 
     # Apply to all People objects
-    for i in building.idfobjects['people']:
+    people_objs = building.idfobjects['people']
+    for i in people_objs:
         i.Number_of_People_Schedule_Name = 'On'
 
     if verbose_mode:
@@ -1180,6 +1338,10 @@ def add_vrf_system(
     :param VRFschedule: Name of the availability schedule for the VRF system.
     :param verbose_mode: If True, prints progress from the accim_Main job.
     """
+    # Imported here so that the aPMV pipeline does not pay for loading accim_Main
+    # unless a VRF system is actually requested.
+    import accim.sim.accim_Main_single_idf as accim_Main
+
     EnergyPlus_version = f'{building.idd_version[0]}.{building.idd_version[1]}'
 
     z = accim_Main.accimJob(
@@ -1216,17 +1378,21 @@ def change_adaptive_coeff(building: IDF, df_arguments: pd.DataFrame):
     :param building: The BESOS/eppy IDF object.
     :param df_arguments: DataFrame containing the new coefficients, indexed by target key.
     """
-    for i in df_arguments.index:
-        zonename = df_arguments.loc[i, 'underscore_zonename']
+    # Index the zone input programs by lowercase name once, so that each target
+    # is resolved with a dict lookup instead of a scan over all EMS programs.
+    programs = {p.Name.lower(): p for p in building.idfobjects['EnergyManagementSystem:Program']
+                if 'set_zone_input_data' in p.Name}
+
+    for row in df_arguments.to_dict(orient='records'):
+        zonename = row['underscore_zonename']
 
         # Find the specific program for this zone/space
-        program = [p for p in building.idfobjects['EnergyManagementSystem:Program']
-                   if 'set_zone_input_data' in p.Name and zonename.lower() in p.Name.lower()]
+        program = programs.get(f'set_zone_input_data_{zonename}'.lower())
 
-        if program:
+        if program is not None:
             # Update the lines corresponding to adaptive coefficients
-            program[0].Program_Line_1 = f'set adap_coeff_cooling_{zonename} = {df_arguments.loc[i, "adap_coeff_cooling"]}'
-            program[0].Program_Line_2 = f'set adap_coeff_heating_{zonename} = {df_arguments.loc[i, "adap_coeff_heating"]}'
+            program.Program_Line_1 = f'set adap_coeff_cooling_{zonename} = {row["adap_coeff_cooling"]}'
+            program.Program_Line_2 = f'set adap_coeff_heating_{zonename} = {row["adap_coeff_heating"]}'
 
 
 def add_ems_debug_output(building: IDF, verbose_mode: bool = True):
@@ -1246,9 +1412,7 @@ def add_ems_debug_output(building: IDF, verbose_mode: bool = True):
     :param verbose_mode: If True, prints success messages. Warnings are always printed.
     """
     # Check if the object already exists to avoid duplicates
-    output_ems_objs = [i for i in building.idfobjects['Output:EnergyManagementSystem']]
-
-    if len(output_ems_objs) == 0:
+    if not building.idfobjects['Output:EnergyManagementSystem']:
         building.newidfobject(
             key='Output:EnergyManagementSystem',
             Actuator_Availability_Dictionary_Reporting='Verbose',
@@ -1290,7 +1454,8 @@ def set_pmv_input_parameters(
 
     # 1. Resolve targets to map People objects to Data Keys
     target_data = _resolve_targets(building)
-    df_keys = [t['df_key'] for t in target_data]
+    df_keys = [t.df_key for t in target_data]
+    df_keys_set = set(df_keys)
 
     # Helper to map input args (Float, Dict, or None) to a lookup dictionary
     def map_arg_to_lookup(arg_val, arg_name):
@@ -1300,8 +1465,7 @@ def set_pmv_input_parameters(
 
         if isinstance(arg_val, dict):
             # Validate keys
-            valid_keys = [k for k in arg_val if k in df_keys]
-            dropped = [k for k in arg_val if k not in df_keys]
+            dropped = [k for k in arg_val if k not in df_keys_set]
             if dropped:
                 warnings.warn(f"Keys dropped from {arg_name}: {dropped}")
 
@@ -1331,26 +1495,19 @@ def set_pmv_input_parameters(
         pass
 
     def get_first_item_from_list(obj, field_prefix):
-        try:
-            return obj[f"{field_prefix}_1_Name"]
-        except:
-            return None
+        items = _get_list_items(obj, field_prefix)
+        return items[0] if items else None
 
-    sch_comp_objs = [s.Name for s in building.idfobjects['Schedule:Compact']]
+    sch_comp_objs = {s.Name for s in building.idfobjects['Schedule:Compact']}
 
     # 3. Iterate over People objects
-    for people in building.idfobjects['PEOPLE']:
+    people_objs = building.idfobjects['PEOPLE']
+    container_field = _get_people_container_field(people_objs[0]) if people_objs else None
+    for people in people_objs:
         p_name = people.Name
 
         # --- A. Find the Target Key for this Person ---
-        container_name = ""
-        try:
-            container_name = people.Zone_or_ZoneList_Name
-        except:
-            try:
-                container_name = people.Zone_or_ZoneList_or_Space_or_SpaceList_Name
-            except:
-                container_name = people.Zone_Name
+        container_name = getattr(people, container_field)
 
         if not container_name: continue
         c_name_upper = container_name.upper().strip()
@@ -1370,9 +1527,9 @@ def set_pmv_input_parameters(
             # Direct Zone: Try both patterns
             candidate_1 = f"{container_name} {p_name}"
             candidate_2 = container_name
-            if candidate_1 in df_keys:
+            if candidate_1 in df_keys_set:
                 target_key = candidate_1
-            elif candidate_2 in df_keys:
+            elif candidate_2 in df_keys_set:
                 target_key = candidate_2
 
         if not target_key:
@@ -1396,9 +1553,9 @@ def set_pmv_input_parameters(
         if act_val is not None:
             sch_name = f"Sch_Act_{p_name_san}"
             if sch_name not in sch_comp_objs:
-                building.newidfobject('Schedule:Compact', Name=sch_name, Schedule_Type_Limits_Name="Any Number",
+                building.newidfobject('Schedule:Compact', defaultvalues=False, Name=sch_name, Schedule_Type_Limits_Name="Any Number",
                                       Field_1='Through: 12/31', Field_2='For: AllDays', Field_3=f'Until: 24:00,{act_val}')
-                sch_comp_objs.append(sch_name)
+                sch_comp_objs.add(sch_name)
                 if verbose_mode: print(f"Set Activity for '{p_name}': {act_val} W/person")
 
             people.Activity_Level_Schedule_Name = sch_name
@@ -1408,9 +1565,9 @@ def set_pmv_input_parameters(
         if clo_val is not None:
             sch_name = f"Sch_Clo_{p_name_san}"
             if sch_name not in sch_comp_objs:
-                building.newidfobject('Schedule:Compact', Name=sch_name, Schedule_Type_Limits_Name="Any Number",
+                building.newidfobject('Schedule:Compact', defaultvalues=False, Name=sch_name, Schedule_Type_Limits_Name="Any Number",
                                       Field_1='Through: 12/31', Field_2='For: AllDays', Field_3=f'Until: 24:00,{clo_val}')
-                sch_comp_objs.append(sch_name)
+                sch_comp_objs.add(sch_name)
                 if verbose_mode: print(f"Set Clothing for '{p_name}': {clo_val} clo")
 
             # people.Clothing_Insulation_Calculation_Method = 'Schedule'
@@ -1422,9 +1579,9 @@ def set_pmv_input_parameters(
         if vel_val is not None:
             sch_name = f"Sch_Vel_{p_name_san}"
             if sch_name not in sch_comp_objs:
-                building.newidfobject('Schedule:Compact', Name=sch_name, Schedule_Type_Limits_Name="Any Number",
+                building.newidfobject('Schedule:Compact', defaultvalues=False, Name=sch_name, Schedule_Type_Limits_Name="Any Number",
                                       Field_1='Through: 12/31', Field_2='For: AllDays', Field_3=f'Until: 24:00,{vel_val}')
-                sch_comp_objs.append(sch_name)
+                sch_comp_objs.add(sch_name)
                 if verbose_mode: print(f"Set Air Velocity for '{p_name}': {vel_val} m/s")
 
             people.Air_Velocity_Schedule_Name = sch_name
@@ -1434,9 +1591,9 @@ def set_pmv_input_parameters(
         if eff_val is not None:
             sch_name = f"Sch_Eff_{p_name_san}"
             if sch_name not in sch_comp_objs:
-                building.newidfobject('Schedule:Compact', Name=sch_name, Schedule_Type_Limits_Name="Any Number",
+                building.newidfobject('Schedule:Compact', defaultvalues=False, Name=sch_name, Schedule_Type_Limits_Name="Any Number",
                                       Field_1='Through: 12/31', Field_2='For: AllDays', Field_3=f'Until: 24:00,{eff_val}')
-                sch_comp_objs.append(sch_name)
+                sch_comp_objs.add(sch_name)
                 if verbose_mode: print(f"Set Work Efficiency for '{p_name}': {eff_val}")
 
             people.Work_Efficiency_Schedule_Name = sch_name